@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import atexit
+import base64
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit
+
+import orjson
+from aiohttp import ClientTimeout
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
@@ -12,6 +23,8 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from .const import (
     DOMAIN,
     DEFAULT_UPDATE_INTERVAL,
+    TOKEN_STORAGE_VERSION,
+    TOKEN_EXPIRY_MARGIN,
     CONF_METER_ID,
     CONF_EAN,
     CONF_API_BASE,
@@ -21,20 +34,44 @@ from .const import (
     CONF_TIME_WINDOW_HOURS,
     DEFAULT_GRANULARITY,
     DEFAULT_TIME_WINDOW_HOURS,
+    MIN_UPDATE_INTERVALS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Separate connect/read budgets so a dead connection fails fast instead of using the full minute.
+REQUEST_TIMEOUT = ClientTimeout(total=60, sock_connect=10, sock_read=30)
+
+
+def _format_history_timestamp(dt: datetime) -> str:
+    """Format a datetime as the local-time timestamp expected by historyFrom/historyUntil.
+
+    The offset is taken per call (not cached) so the window stays correct across DST changes.
+    """
+    return dt.astimezone().strftime("%Y-%m-%dT%H:%M:%S.000%z")
+
+
+def _token_expiry(token: str) -> float | None:
+    """Return the exp claim (epoch seconds) of a JWT bearer token, or None if undecodable."""
+    try:
+        payload = token.split(" ", 1)[-1].split(".")[1]
+        claims = orjson.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except Exception:
+        return None
+
 
 class FluviusCoordinator(DataUpdateCoordinator):
     """Coordinator to fetch Fluvius data and optionally retrieve token via credentials.
 
-    Important: bearer token is kept only in memory and NOT persisted to the config entry.
+    Important: bearer token is NOT persisted to the config entry. It is cached in memory and in
+    HA storage until it expires, so a restart does not need a new browser login.
     """
 
     def __init__(
         self,
         hass: HomeAssistant,
+        entry_id: str,
         name: str,
         username: str | None,
         password: str | None,
@@ -46,6 +83,9 @@ class FluviusCoordinator(DataUpdateCoordinator):
         update_interval: int,
     ):
         """Initialize."""
+        granularity = str(granularity or DEFAULT_GRANULARITY)
+        # Polling faster than the data cadence only re-downloads identical readings.
+        update_interval = max(int(update_interval), MIN_UPDATE_INTERVALS.get(granularity, 0))
         super().__init__(
             hass,
             _LOGGER,
@@ -54,50 +94,130 @@ class FluviusCoordinator(DataUpdateCoordinator):
         )
         self.hass = hass
         self.name = name
-        # Store credentials (persisted by config entry). Token is cached only in memory.
+        # Store credentials (persisted by config entry). Token is cached in memory and in
+        # private HA storage (never in the config entry).
         self._username = username
         self._password = password
-        self._bearer_token: str | None = None  # in-memory cache only
+        self._bearer_token: str | None = None
+        self._token_store = Store(hass, TOKEN_STORAGE_VERSION, _token_store_key(entry_id), private=True)
         self.ean = ean
         self.meter_id = meter_id
         self.api_base = (api_base or "https://mijn.fluvius.be").rstrip("/")
-        self.granularity = str(granularity or DEFAULT_GRANULARITY)
+        self.granularity = granularity
         self.time_window_hours = int(time_window_hours or DEFAULT_TIME_WINDOW_HOURS)
         self._last_data = None
+        # Home Assistant's shared session keeps the connection to Fluvius pooled between polls.
+        self._session = async_get_clientsession(hass)
+        # Request pieces that only depend on configuration; built once instead of every poll.
+        self._url = f"{self.api_base}/verbruik/api/meter-measurement-history/{self.ean or ''}"
+        self._base_params = {
+            "granularity": self.granularity,
+            "asServiceProvider": "false",
+            "meterSerialNumber": self.meter_id or "",
+        }
+        self._base_headers = {
+            "Accept": "application/json",
+            "User-Agent": "HomeAssistant/Integration",
+            "Connection": "keep-alive",
+        }
+        self.totals: dict[str, float] = {}
 
     def _set_bearer_token(self, token: str | None) -> None:
-        """Set the in-memory token cache (not persisted)."""
+        """Set the in-memory token cache."""
         self._bearer_token = token
 
+    async def _async_load_stored_token(self) -> str | None:
+        """Return the stored token if it belongs to this account and is not about to expire."""
+        try:
+            stored = await self._token_store.async_load()
+        except Exception as err:
+            _LOGGER.debug("Unable to load stored Fluvius token: %s", err)
+            return None
+        if (
+            stored
+            and stored.get("username") == self._username
+            and stored.get("exp", 0) > time.time() + TOKEN_EXPIRY_MARGIN
+        ):
+            return stored.get("token")
+        return None
+
     async def _async_get_bearer_token_if_needed(self) -> str:
         """Ensure we have a bearer token, obtain one using credentials if necessary.
 
-        Token will be cached in memory for this running instance only; it will not be saved
-        into the config entry.
+        A still-valid token saved by a previous run is reused before falling back to a browser
+        login. The token is never saved into the config entry.
         """
         if self._bearer_token:
             return self._bearer_token
 
+        token = await self._async_load_stored_token()
+        if token:
+            _LOGGER.debug("Reusing stored Fluvius bearer token")
+            self._set_bearer_token(token)
+            return token
+
         if not self._username or not self._password:
             raise UpdateFailed("No username/password configured to acquire token")
 
-        # Run blocking selenium token fetch in executor
-        token = await self.hass.async_add_executor_job(
-            _fetch_bearer_token_sync, self._username, self._password
-        )
+        token, _status, _url = await _async_fetch_bearer_token(self.hass, self._username, self._password)
         if not token:
             raise UpdateFailed("Failed to retrieve bearer token using provided credentials")
-        # Cache in memory only
         self._set_bearer_token(token)
+
+        exp = _token_expiry(token)
+        if exp:
+            await self._token_store.async_save({"token": token, "exp": exp, "username": self._username})
         return token
 
+    @staticmethod
+    def _compute_totals(data) -> dict[str, float]:
+        """Sum consumption (dc == 1) and injection (dc == 2) readings in a single pass.
+
+        Builtins are bound to locals so the inner loop avoids global/builtin lookups.
+        """
+        if not data:
+            return {}
+
+        _isinstance = isinstance
+        _dict = dict
+        _float = float
+        cons = 0.0
+        inj = 0.0
+        try:
+            for day in data:
+                readings = day.get("v")
+                if not readings:
+                    continue
+                for reading in readings:
+                    if not _isinstance(reading, _dict):
+                        continue
+                    rget = reading.get
+                    val = rget("v")
+                    if val is None:
+                        continue
+                    # Readings without a direction count as consumption, as they always have.
+                    dc = rget("dc", 1)
+                    if dc == 1:
+                        cons += _float(val)
+                    elif dc == 2:
+                        inj += _float(val)
+        except Exception as err:
+            _LOGGER.debug("Error parsing Fluvius data: %s", err)
+            return {}
+
+        return {
+            "consumption": round(cons, 3),
+            "injection": round(inj, 3),
+            "net": round(cons - inj, 3),
+        }
+
     async def _async_update_data(self):
         """
         Fetch data from Fluvius-style API.
 
         Uses the in-memory bearer token (fetched on demand from credentials).
         """
-        session = async_get_clientsession(self.hass)
+        session = self._session
         try:
             token = await self._async_get_bearer_token_if_needed()
 
@@ -105,41 +225,33 @@ class FluviusCoordinator(DataUpdateCoordinator):
             until = datetime.now(timezone.utc)
             since = until - timedelta(hours=self.time_window_hours)
 
-            def fmt(dt: datetime) -> str:
-                return dt.astimezone().strftime("%Y-%m-%dT%H:%M:%S.000%z")
-
             params = {
-                "historyFrom": fmt(since),
-                "historyUntil": fmt(until),
-                "granularity": str(self.granularity),
-                "asServiceProvider": "false",
-                "meterSerialNumber": self.meter_id or "",
-            }
-
-            url = f"{self.api_base}/verbruik/api/meter-measurement-history/{self.ean or ''}"
-
-            headers = {
-                "Authorization": token,
-                "Accept": "application/json",
-                "User-Agent": "HomeAssistant/Integration",
+                **self._base_params,
+                "historyFrom": _format_history_timestamp(since),
+                "historyUntil": _format_history_timestamp(until),
             }
+            headers = {**self._base_headers, "Authorization": token}
+            url = self._url
 
             _LOGGER.debug("Requesting Fluvius data URL=%s params=%s", url, params)
-            resp = await session.get(url, params=params, headers=headers, timeout=60)
-            text = await resp.text()
+            resp = await session.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
             if resp.status != 200:
+                # Only materialize the body as text when we need it for the error message.
+                text = await resp.text()
                 if resp.status == 401:
                     _LOGGER.warning("Received 401 from Fluvius; clearing cached token")
-                    # Clear in-memory token so next update fetches a new one
+                    # Clear cached token so next update fetches a new one
                     self._set_bearer_token(None)
+                    await self._token_store.async_remove()
                 raise UpdateFailed(f"HTTP {resp.status}: {text[:300]}")
 
             try:
-                data = await resp.json()
+                data = await resp.json(loads=orjson.loads)
             except Exception as err:
                 raise UpdateFailed(f"Invalid JSON response: {err}") from err
 
             self._last_data = data
+            self.totals = self._compute_totals(data)
             return data
 
         except UpdateFailed:
@@ -151,6 +263,12 @@ class FluviusCoordinator(DataUpdateCoordinator):
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the integration from YAML (not used)."""
     hass.data.setdefault(DOMAIN, {})
+
+    async def _async_handle_stop(event: Event) -> None:
+        # The token worker is not part of HA's executor, so HA's shutdown timeouts don't cover it.
+        await hass.async_add_executor_job(_shutdown_token_executor)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_handle_stop)
     return True
 
 
@@ -180,6 +298,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     coordinator = FluviusCoordinator(
         hass,
+        entry_id=entry.entry_id,
         name=name,
         username=username,
         password=password,
@@ -208,44 +327,214 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, ["sensor"])
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        if not hass.data[DOMAIN]:
+            # Last entry gone: no more re-auth will happen, release the browser and its worker.
+            await hass.async_add_executor_job(_shutdown_token_executor)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored bearer token when the config entry is deleted."""
+    await Store(hass, TOKEN_STORAGE_VERSION, _token_store_key(entry.entry_id)).async_remove()
+
+
+def _token_store_key(entry_id: str) -> str:
+    """Return the HA storage key holding the cached token for a config entry."""
+    return f"{DOMAIN}_{entry_id}_token"
+
+
+async def _async_fetch_bearer_token(
+    hass: HomeAssistant, username: str, password: str
+) -> tuple[str | None, int | None, str | None]:
+    """Obtain a bearer token for the given credentials.
+
+    Single entry point for token retrieval used by the coordinator and the config flow. The
+    Fluvius login is driven through a headless browser, so the blocking helper below runs on
+    a dedicated single-thread executor rather than Home Assistant's shared one: a login takes
+    several seconds and would otherwise hold a slot other integrations need.
+
+    Returns (token, status, url) where url is the captured API request that carried the token
+    and status is the HTTP status the Fluvius API returned to it (None if not observed).
+    """
+    return await hass.loop.run_in_executor(
+        _token_executor(), _fetch_bearer_token_sync, username, password
+    )
+
+
 # ---------- Blocking helper using selenium + selenium-wire ----------
-def _fetch_bearer_token_sync(username: str, password: str, timeout: int = 60) -> str | None:
+# A single headless browser is kept for the lifetime of the process so that re-auth after
+# a 401 does not pay for a new Chrome + selenium-wire proxy launch every time.
+_DRIVER_LOCK = threading.Lock()
+_DRIVER = None
+# Origins whose web storage a login leaves behind; the B2C origin is added once seen.
+_LOGIN_ORIGINS = {"https://mijn.fluvius.be"}
+# Browser work is serialized by _DRIVER_LOCK anyway, so one worker thread is enough.
+# Created on first use and shut down on unload of the last entry / Home Assistant stop.
+_TOKEN_EXECUTOR: ThreadPoolExecutor | None = None
+
+
+def _token_executor() -> ThreadPoolExecutor:
+    """Return the token worker pool, creating it if needed (event loop only)."""
+    global _TOKEN_EXECUTOR
+    if _TOKEN_EXECUTOR is None:
+        _TOKEN_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fluvius_token")
+    return _TOKEN_EXECUTOR
+
+
+def _shutdown_token_executor() -> None:
+    """Shut the token worker down and kill the browser (blocking, not on the token worker).
+
+    Queued logins are cancelled. A login in progress holds _DRIVER_LOCK and its worker thread
+    is not a daemon, so in that case the browser is quit without the lock: its pending webdriver
+    calls then fail at once instead of running into the 30s/60s timeouts and delaying exit.
+    """
+    global _TOKEN_EXECUTOR
+    executor, _TOKEN_EXECUTOR = _TOKEN_EXECUTOR, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if _DRIVER_LOCK.acquire(blocking=False):
+        try:
+            _discard_driver()
+        finally:
+            _DRIVER_LOCK.release()
+        return
+
+    driver = _DRIVER
+    if driver is not None:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+def _discard_driver() -> None:
+    """Quit the shared webdriver and forget it. Caller must hold _DRIVER_LOCK."""
+    global _DRIVER
+    if _DRIVER is None:
+        return
+    try:
+        _DRIVER.quit()
+    except Exception:
+        pass
+    _DRIVER = None
+
+
+def _quit_driver() -> None:
+    """Quit the shared webdriver, if any (blocking)."""
+    with _DRIVER_LOCK:
+        _discard_driver()
+
+
+def _reset_browser_session(driver) -> None:
+    """Drop all web state left by a previous login so the next one starts from scratch.
+
+    Raises if the browser does not respond; the caller then starts a new one.
+    """
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    # localStorage/IndexedDB hold the SPA's and B2C's token caches.
+    for origin in _LOGIN_ORIGINS:
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+    # sessionStorage is scoped to the tab: continue in a fresh one.
+    old_handle = driver.current_window_handle
+    driver.switch_to.new_window("tab")
+    new_handle = driver.current_window_handle
+    driver.switch_to.window(old_handle)
+    driver.close()
+    driver.switch_to.window(new_handle)
+    del driver.requests
+
+
+atexit.register(_quit_driver)
+
+
+def _fetch_bearer_token_sync(
+    username: str, password: str, timeout: int = 60
+) -> tuple[str | None, int | None, str | None]:
     """
     Blocking token fetch using selenium-wire to capture network requests and extract Authorization header.
 
-    NOTE: This runs in an executor from Home Assistant. It requires:
+    NOTE: This runs on the token worker (see _token_executor), off the event loop. It requires:
       - selenium and selenium-wire Python packages (listed in manifest requirements)
       - Chrome/Chromium and matching ChromeDriver available on the system PATH
       - 2FA is not supported (the automation expects username/password to reach the logged-in web app)
 
-    The token returned by this helper is intentionally NOT persisted by the integration; it's
-    cached in memory only so that the integration can reuse it while the Home Assistant process runs.
+    The token returned by this helper is never written to the config entry; the coordinator
+    caches it in memory and in HA storage until it expires.
+
+    The browser itself is shared across calls (see _DRIVER); cookies, the login origins' web
+    storage, the tab and captured requests are reset before each login so every call performs a
+    fresh authentication.
     """
+    global _DRIVER
     try:
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
         from seleniumwire import webdriver
-        import time
     except Exception as exc:
         _LOGGER.exception("Selenium or selenium-wire not available: %s", exc)
-        return None
+        return None, None, None
 
     chrome_options = webdriver.ChromeOptions()
     chrome_options.add_argument("--headless")
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
-    seleniumwire_options = {"enable_har": True}
+    # Images are irrelevant for the login; skip downloading and decoding them.
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_experimental_option(
+        "prefs", {"profile.managed_default_content_settings.images": 2}
+    )
+    # Only one header is needed: no HAR, and keep a small bounded in-memory request store.
+    seleniumwire_options = {
+        "disable_encoding": True,
+        "request_storage": "memory",
+        "request_storage_max_size": 100,
+    }
+
+    with _DRIVER_LOCK:
+        if _DRIVER is not None:
+            # Reuse the warm browser; drop the previous session so we log in again.
+            try:
+                _reset_browser_session(_DRIVER)
+            except Exception as exc:
+                _LOGGER.debug("Discarding unusable browser: %s", exc)
+                _discard_driver()
+
+        if _DRIVER is None:
+            try:
+                _DRIVER = webdriver.Chrome(options=chrome_options, seleniumwire_options=seleniumwire_options)
+                _DRIVER.set_page_load_timeout(timeout)
+            except Exception as exc:
+                _LOGGER.exception("Unable to start browser for token retrieval: %s", exc)
+                _discard_driver()
+                return None, None, None
+
+        return _login_and_capture_token(_DRIVER, username, password)
+
+
+def _find_bearer_request(driver):
+    """Return the first captured request carrying a Bearer Authorization header, if any."""
+    for request in driver.requests:
+        auth_header = request.headers.get("Authorization")
+        if auth_header and auth_header.startswith("Bearer"):
+            return request
+    return None
+
+
+def _login_and_capture_token(driver, username: str, password: str) -> tuple[str | None, int | None, str | None]:
+    """Log in on the Fluvius web app with the given driver and return the captured token.
+
+    Also returns the URL of that request and the status of its API response, if any.
+    """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
 
-    driver = None
     try:
-        driver = webdriver.Chrome(options=chrome_options, seleniumwire_options=seleniumwire_options)
-        driver.set_page_load_timeout(timeout)
         _LOGGER.info("Authenticating with Fluvius web app to obtain token...")
 
+        # Only capture the consumption API calls; that is where the token shows up.
+        driver.scopes = [r".*/verbruik/api/.*"]
+
         driver.get("https://mijn.fluvius.be")
         wait = WebDriverWait(driver, 30)
 
@@ -260,6 +549,8 @@ def _fetch_bearer_token_sync(username: str, password: str, timeout: int = 60) ->
             pass
 
         email_input = wait.until(EC.visibility_of_element_located((By.ID, "signInName")))
+        login_url = urlsplit(driver.current_url)
+        _LOGIN_ORIGINS.add(f"{login_url.scheme}://{login_url.netloc}")
         email_input.send_keys(username)
 
         password_input = driver.find_element(By.ID, "password")
@@ -277,29 +568,33 @@ def _fetch_bearer_token_sync(username: str, password: str, timeout: int = 60) ->
             pass
 
         driver.get("https://mijn.fluvius.be/verbruik")
-        time.sleep(5)
+        deadline = time.monotonic() + 15
+        try:
+            driver.wait_for_request(r"/verbruik/api/", timeout=15)
+        except TimeoutException:
+            pass
 
-        for request in driver.requests:
-            try:
-                if "/api/" in request.url and request.headers.get("Authorization"):
-                    auth_header = request.headers.get("Authorization")
-                    if auth_header and auth_header.startswith("Bearer"):
-                        _LOGGER.info("Successfully retrieved Bearer token via browser automation")
-                        return auth_header
-            except Exception:
-                continue
+        # The first API call is not necessarily authenticated; look for one that is.
+        request = _find_bearer_request(driver)
+        while request is None and time.monotonic() < deadline:
+            time.sleep(0.5)
+            request = _find_bearer_request(driver)
+
+        if request is not None:
+            _LOGGER.info("Successfully retrieved Bearer token via browser automation")
+            status = request.response.status_code if request.response else None
+            return request.headers["Authorization"], status, request.url
 
         _LOGGER.error("No Bearer token found in captured requests (possible 2FA or changed flow)")
-        return None
+        return None, None, None
 
     except Exception as exc:
         _LOGGER.exception("Exception during token retrieval: %s", exc)
-        return None
+        return None, None, None
 
     finally:
+        # Stop the logged-in app from running (and polling the API) until the next login.
         try:
-            if driver:
-                driver.quit()
+            driver.get("about:blank")
         except Exception:
             pass
-
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import orjson
 import voluptuous as vol
+from types import MappingProxyType
 from typing import Any
+from urllib.parse import urlsplit
 
 from homeassistant import config_entries
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
@@ -22,13 +25,13 @@ from .const import (
 )
 
 # For obtaining a bearer token via browser automation we reuse the helper from __init__.
-from . import _fetch_bearer_token_sync  # type: ignore
+from . import REQUEST_TIMEOUT, _async_fetch_bearer_token, _format_history_timestamp  # type: ignore
 
 from datetime import datetime, timedelta, timezone
 
 # Prepare label lists for the UI: show friendly labels, map back to numeric keys internally.
-GRAN_LABELS = list(GRANULARITY_CHOICES.values())
-_LABEL_TO_KEY = {v: k for k, v in GRANULARITY_CHOICES.items()}
+GRAN_LABELS = tuple(GRANULARITY_CHOICES.values())
+_LABEL_TO_KEY = MappingProxyType({v: k for k, v in GRANULARITY_CHOICES.items()})
 
 # Default granularity label
 DEFAULT_GRANULARITY_LABEL = GRANULARITY_CHOICES.get(DEFAULT_GRANULARITY, GRAN_LABELS[0])
@@ -48,6 +51,13 @@ DATA_SCHEMA = vol.Schema(
 )
 
 
+def _is_history_call_for_ean(api_url: str | None, ean: str) -> bool:
+    """Return True if api_url is the meter-measurement-history call for exactly this EAN."""
+    if not api_url:
+        return False
+    return urlsplit(api_url).path.rstrip("/").endswith(f"/meter-measurement-history/{ean}")
+
+
 async def _validate_token(hass, token: str, ean: str, api_base: str) -> bool:
     """Validate a bearer token by making a small API request.
 
@@ -60,12 +70,9 @@ async def _validate_token(hass, token: str, ean: str, api_base: str) -> bool:
     until = datetime.now(timezone.utc)
     since = until - timedelta(hours=1)
 
-    def fmt(dt: datetime) -> str:
-        return dt.astimezone().strftime("%Y-%m-%dT%H:%M:%S.000%z")
-
     params = {
-        "historyFrom": fmt(since),
-        "historyUntil": fmt(until),
+        "historyFrom": _format_history_timestamp(since),
+        "historyUntil": _format_history_timestamp(until),
         "granularity": "1",  # smallest test granularity
         "asServiceProvider": "false",
         "meterSerialNumber": "",
@@ -76,14 +83,15 @@ async def _validate_token(hass, token: str, ean: str, api_base: str) -> bool:
         "Authorization": token,
         "Accept": "application/json",
         "User-Agent": "HomeAssistant/Integration",
+        "Connection": "keep-alive",
     }
 
     try:
-        resp = await session.get(url, params=params, headers=headers, timeout=15)
+        resp = await session.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
         if resp.status != 200:
             return False
         try:
-            await resp.json()
+            await resp.json(loads=orjson.loads)
             return True
         except Exception:
             return False
@@ -114,21 +122,23 @@ class fluvius_electricity_belgiumConfigFlow(config_entries.ConfigFlow, domain=DO
         if not ean:
             return self.async_show_form(step_id="user", data_schema=DATA_SCHEMA, errors="missing_ean")
 
-        # Use provided credentials to try to obtain token (in executor) and validate it.
-        token = await self.hass.async_add_executor_job(_fetch_bearer_token_sync, username, password)
+        # Use provided credentials to try to obtain token and validate it.
+        token, status, api_url = await _async_fetch_bearer_token(self.hass, username, password)
         if not token:
             return self.async_show_form(step_id="user", data_schema=DATA_SCHEMA, errors="invalid_credentials_or_2fa")
 
-        ok = await _validate_token(self.hass, token, ean, api_base)
-        if not ok:
+        # Skip the explicit check only if the browser already saw the API accept this token for
+        # this very meter; otherwise validate, which also verifies the entered EAN.
+        seen_ok = status == 200 and _is_history_call_for_ean(api_url, ean)
+        if not seen_ok and not await _validate_token(self.hass, token, ean, api_base):
             return self.async_show_form(step_id="user", data_schema=DATA_SCHEMA, errors="invalid_credentials_or_token")
 
         # Map granularity label back to internal key
         gran_key = _LABEL_TO_KEY.get(gran_label, DEFAULT_GRANULARITY)
 
         title = user_input.get("name", "Fluvius Electricity")
-        # IMPORTANT: we DO NOT persist the bearer token. We persist username/password so the coordinator
-        # can re-fetch tokens after restart.
+        # IMPORTANT: we DO NOT store the bearer token in the config entry. We persist username/password
+        # so the coordinator can re-fetch tokens once the cached one expires.
         data = {
             "name": title,
             CONF_USERNAME: username,
@@ -4,6 +4,10 @@ PLATFORMS = ["sensor"]
 DEFAULT_NAME = "Fluvius Electricity"
 DEFAULT_UPDATE_INTERVAL = 1800  # seconds (30 minutes)
 
+# Bearer token cache in HA storage (.storage/<DOMAIN>_<entry_id>_token)
+TOKEN_STORAGE_VERSION = 1
+TOKEN_EXPIRY_MARGIN = 60  # seconds; stored tokens closer than this to expiry are not reused
+
 CONF_METER_ID = "meter_id"
 CONF_EAN = "ean"
 CONF_BEARER_TOKEN = "bearer_token"
@@ -24,4 +28,11 @@ GRANULARITY_CHOICES = {
     "3": "Daily (per day)",
 }
 
+# Minimum poll interval (seconds) per granularity; new readings never arrive faster than this
+MIN_UPDATE_INTERVALS = {
+    "1": 600,
+    "2": 900,
+    "3": 3600,
+}
+
 
@@ -5,6 +5,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ENERGY_KILO_WATT_HOUR
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, DEFAULT_NAME
 from . import FluviusCoordinator
@@ -23,33 +24,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
             FluviusConsumptionSensor(coordinator, name),
             FluviusInjectionSensor(coordinator, name),
             FluviusNetSensor(coordinator, name),
-        ],
-        True,
+        ]
     )
 
 
-class FluviusBaseEnergySensor(SensorEntity):
-    """Base sensor for Fluvius energy values."""
+class FluviusBaseEnergySensor(CoordinatorEntity, SensorEntity):
+    """Base sensor for Fluvius energy values.
+
+    State is pushed by the coordinator; the sensors never poll on their own.
+    """
 
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = ENERGY_KILO_WATT_HOUR
+    _attr_should_poll = False
 
     def __init__(self, coordinator: FluviusCoordinator, name: str, kind: str):
         """Initialize the sensor."""
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self.kind = kind  # 'consumption' or 'injection' or 'net'
         self._attr_name = f"{name} {kind.capitalize()}"
         self._attr_unique_id = f"fluvius_{coordinator.meter_id or 'default'}_{kind}"
         self._attr_native_value = None
 
     @property
-    def available(self) -> bool:
-        return self.coordinator.last_update_success
-
-    async def async_update(self):
-        """Request the coordinator to refresh."""
-        await self.coordinator.async_request_refresh()
+    def native_value(self):
+        """Return the total for this sensor kind, computed once per coordinator refresh."""
+        return self.coordinator.totals.get(self.kind)
 
 
 class FluviusConsumptionSensor(FluviusBaseEnergySensor):
@@ -58,28 +59,6 @@ class FluviusConsumptionSensor(FluviusBaseEnergySensor):
     def __init__(self, coordinator: FluviusCoordinator, name: str):
         super().__init__(coordinator, name, "consumption")
 
-    @property
-    def native_value(self):
-        data = self.coordinator.data or []
-        if not data:
-            return None
-
-        total = 0.0
-        try:
-            for day in data:
-                for reading in day.get("v", []):
-                    if not isinstance(reading, dict):
-                        continue
-                    val = reading.get("v")
-                    if val is None:
-                        continue
-                    if reading.get("dc", 1) == 1:
-                        total += float(val)
-            return round(total, 3)
-        except Exception as err:
-            _LOGGER.debug("Error parsing Fluvius consumption data: %s", err)
-            return None
-
 
 class FluviusInjectionSensor(FluviusBaseEnergySensor):
     """Sensor that sums injection readings (dc == 2)."""
@@ -87,59 +66,9 @@ class FluviusInjectionSensor(FluviusBaseEnergySensor):
     def __init__(self, coordinator: FluviusCoordinator, name: str):
         super().__init__(coordinator, name, "injection")
 
-    @property
-    def native_value(self):
-        data = self.coordinator.data or []
-        if not data:
-            return None
-
-        total = 0.0
-        try:
-            for day in data:
-                for reading in day.get("v", []):
-                    if not isinstance(reading, dict):
-                        continue
-                    val = reading.get("v")
-                    if val is None:
-                        continue
-                    if reading.get("dc", 0) == 2:
-                        total += float(val)
-            return round(total, 3)
-        except Exception as err:
-            _LOGGER.debug("Error parsing Fluvius injection data: %s", err)
-            return None
-
 
 class FluviusNetSensor(FluviusBaseEnergySensor):
     """Sensor providing net consumption (consumption - injection)."""
 
     def __init__(self, coordinator: FluviusCoordinator, name: str):
         super().__init__(coordinator, name, "net")
-
-    @property
-    def native_value(self):
-        data = self.coordinator.data or []
-        if not data:
-            return None
-
-        cons = 0.0
-        inj = 0.0
-        try:
-            for day in data:
-                for reading in day.get("v", []):
-                    if not isinstance(reading, dict):
-                        continue
-                    val = reading.get("v")
-                    if val is None:
-                        continue
-                    dc = reading.get("dc", 0)
-                    if dc == 1:
-                        cons += float(val)
-                    elif dc == 2:
-                        inj += float(val)
-            net = cons - inj
-            return round(net, 3)
-        except Exception as err:
-            _LOGGER.debug("Error parsing Fluvius net data: %s", err)
-            return None
-